@@ -2,6 +2,7 @@ import os
 import tempfile
 from git import Repo
 from core.a2a_protocol import A2AMessage
+from core.telemetry import tracer, dir_size
 
 
 class AnalyzerAgent:
@@ -134,17 +135,42 @@ class AnalyzerAgent:
         return test_files
 
     def run(self, github_url):
-        local_path = self.clone_repo(github_url)
-        structure = self.extract_structure(local_path)
-        langs = self.detect_languages(local_path)
-        dependencies = self.extract_dependencies(local_path)
-        cicd = self.detect_cicd(local_path)
-        docker = self.detect_docker(local_path)
-        badges = self.detect_badges(local_path)
-        api_endpoints = self.detect_api_endpoints(local_path)
-        tests = self.detect_tests(local_path)
-
-        summary = f"""Repository structure:
+        with tracer.span("analyzer.run"):
+            summary = self._analyze(github_url)
+
+        message = A2AMessage(
+            from_agent="AnalyzerAgent",
+            to_agent="WriterAgent",
+            message_type="repo_summary",
+            content=summary
+        )
+        return message
+
+    def _analyze(self, github_url):
+        with tracer.span("analyzer.clone") as span:
+            local_path = self.clone_repo(github_url)
+            if tracer.enabled:
+                cloned = dir_size(local_path)
+                span.set(bytes=cloned)
+                tracer.incr("bytes_cloned", cloned)
+        with tracer.span("analyzer.extract_structure"):
+            structure = self.extract_structure(local_path)
+        with tracer.span("analyzer.detect_languages"):
+            langs = self.detect_languages(local_path)
+        with tracer.span("analyzer.extract_dependencies"):
+            dependencies = self.extract_dependencies(local_path)
+        with tracer.span("analyzer.detect_cicd"):
+            cicd = self.detect_cicd(local_path)
+        with tracer.span("analyzer.detect_docker"):
+            docker = self.detect_docker(local_path)
+        with tracer.span("analyzer.detect_badges"):
+            badges = self.detect_badges(local_path)
+        with tracer.span("analyzer.detect_api_endpoints"):
+            api_endpoints = self.detect_api_endpoints(local_path)
+        with tracer.span("analyzer.detect_tests"):
+            tests = self.detect_tests(local_path)
+
+        return f"""Repository structure:
 {structure}
 
 Detected languages:
@@ -157,11 +183,3 @@ Badges: {', '.join(badges) if badges else 'None found'}
 API Endpoints: {', '.join(api_endpoints) if api_endpoints else 'None found'}
 Test files: {', '.join(tests) if tests else 'None found'}
 """
-
-        message = A2AMessage(
-            from_agent="AnalyzerAgent",
-            to_agent="WriterAgent",
-            message_type="repo_summary",
-            content=summary
-        )
-        return message
@@ -1,5 +1,13 @@
 from core.a2a_protocol import A2AMessage
+from core.version_store import VersionStore
+from core.telemetry import tracer
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import html
+import json
 import os
+import threading
+import uuid
 
 
 class ExportAgent:
@@ -21,45 +29,155 @@ class ExportAgent:
     # - Optionally compress or encrypt exported files.
     # - Provide a summary report of export actions.
     #
-    def __init__(self, export_dir="exports"):
+    def __init__(self, export_dir="exports", formats=("html", "pdf"), max_workers=4):
         self.export_dir = export_dir
+        self.formats = formats
         os.makedirs(export_dir, exist_ok=True)
+        self.pool = ThreadPoolExecutor(max_workers=max_workers)
+        self.versions = VersionStore(os.path.join(export_dir, ".versions"))
+        # (filename, format) -> content hash of the Markdown last rendered to that format
+        # Kept in memory and only persisted, since renderers run concurrently
+        self.manifest_path = os.path.join(export_dir, ".export_manifest.json")
+        self._manifest_lock = threading.Lock()
+        self._manifest = self._load_manifest()
+        # One lock per output file, so a render and its manifest entry change together
+        self._output_locks = {}
 
 
     def save_readme(self, content: str, filename="README.md"):
-        """Save README as Markdown and trigger additional export features."""
-        path = os.path.join(self.export_dir, filename)
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(content)
-        # Export to other formats
-        self.export_to_pdf(path)
-        self.export_to_html(path)
-        # Versioning
-        self.save_version(path)
+        """Save README as Markdown and trigger additional export features.
+
+        Returns (path, results): results maps each format to its export_format
+        result, plus "version" for the version store entry.
+        """
+        with tracer.span("export.save_readme", bytes=len(content)):
+            path = os.path.join(self.export_dir, filename)
+            data = content.encode("utf-8")
+            with open(path, "wb") as f:
+                f.write(data)
+            digest = VersionStore.content_hash(data)
+
+            # Format renderers and versioning run concurrently in the worker pool
+            jobs = {fmt: self.pool.submit(tracer.bind(self.export_format), fmt, path, content, digest)
+                    for fmt in self.formats}
+            version_job = self.pool.submit(tracer.bind(self.save_version), path, data)
+            results = {fmt: job.result() for fmt, job in jobs.items()}
+            results["version"] = version_job.result()
+
         # Cloud storage
         self.upload_to_cloud(path)
         # Encryption (optional)
         self.encrypt_export(path)
         # Log export
-        self.log_export(path)
+        self.log_export(path, results)
         # Notifications
         self.send_notification(path)
-        return path
-
-    def export_to_pdf(self, md_path):
-        """Export Markdown to PDF (stub)."""
-        # TODO: Use markdown2pdf or similar library
-        pass
-
-    def export_to_html(self, md_path):
-        """Export Markdown to HTML (stub)."""
-        # TODO: Use markdown2 or similar library
-        pass
-
-    def save_version(self, file_path):
-        """Save a versioned copy of the export (stub)."""
-        # TODO: Implement versioning logic (timestamped copies, etc.)
-        pass
+        return path, results
+
+    def export_format(self, fmt, md_path, content, digest):
+        """Render content to fmt next to md_path, unless this exact content was already exported.
+
+        Returns {"path", "skipped"}; path is None if the renderer is unavailable.
+        """
+        out_path = os.path.splitext(md_path)[0] + "." + fmt
+        key = f"{os.path.basename(md_path)}:{fmt}"
+        with self._output_lock(out_path):
+            with self._manifest_lock:
+                cached = self._manifest.get(key) == digest
+            if cached and os.path.exists(out_path):
+                tracer.cache("export_render", hit=True)
+                return {"path": out_path, "skipped": True}
+            tracer.cache("export_render", hit=False)
+
+            # Render beside the output and swap it in, so readers never see a partial file
+            renderer = {"html": self.export_to_html, "pdf": self.export_to_pdf}[fmt]
+            tmp_path = f"{out_path}.{uuid.uuid4().hex}.tmp"
+            try:
+                with tracer.span("export.render", format=fmt):
+                    rendered = renderer(content, tmp_path)
+                if not rendered:
+                    return {"path": None, "skipped": False}
+                os.replace(tmp_path, out_path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+            with self._manifest_lock:
+                self._manifest[key] = digest
+                self._save_manifest()
+        return {"path": out_path, "skipped": False}
+
+    def _output_lock(self, out_path):
+        with self._manifest_lock:
+            return self._output_locks.setdefault(out_path, threading.Lock())
+
+    def exported_files(self, content, filename="README.md"):
+        """Map format -> path of outputs that were rendered from exactly this content."""
+        digest = VersionStore.content_hash(content.encode("utf-8"))
+        base = os.path.splitext(os.path.join(self.export_dir, filename))[0]
+        outputs = {}
+        for fmt in self.formats:
+            path = f"{base}.{fmt}"
+            with self._output_lock(path):
+                with self._manifest_lock:
+                    current = self._manifest.get(f"{filename}:{fmt}") == digest
+                if current and os.path.exists(path):
+                    outputs[fmt] = path
+        return outputs
+
+    def _load_manifest(self):
+        if not os.path.exists(self.manifest_path):
+            return {}
+        with open(self.manifest_path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def _save_manifest(self):
+        """Write the manifest atomically; callers hold _manifest_lock."""
+        tmp = self.manifest_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self._manifest, f, indent=2)
+        os.replace(tmp, self.manifest_path)
+
+    @staticmethod
+    def render_html(content):
+        try:
+            import markdown
+            body = markdown.markdown(content, extensions=["fenced_code", "tables"])
+        except ImportError:
+            body = f"<pre>{html.escape(content)}</pre>"
+        return f"<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\"><title>README</title></head>\n<body>\n{body}\n</body></html>\n"
+
+    def export_to_pdf(self, content, out_path):
+        """Export Markdown to PDF via HTML. Needs the optional weasyprint package."""
+        try:
+            from weasyprint import HTML
+        except ImportError:
+            return False
+        HTML(string=self.render_html(content)).write_pdf(out_path)
+        return True
+
+    def export_to_html(self, content, out_path):
+        """Export Markdown to a standalone HTML page."""
+        with open(out_path, "w", encoding="utf-8") as f:
+            f.write(self.render_html(content))
+        return True
+
+    def save_version(self, file_path, data: bytes):
+        """Record the export in the content-addressed version store; unchanged content adds nothing."""
+        with tracer.span("export.save_version"):
+            return self.versions.put(os.path.basename(file_path), data)
+
+    def rollback(self, version):
+        """Restore an earlier exported version in place and re-export it to the other formats."""
+        entry = self.versions.entry(version)
+        path = os.path.join(self.export_dir, entry["name"])
+        restored = self.versions.rollback(version, path)
+        with open(path, encoding="utf-8") as f:
+            content = f.read()
+        jobs = [self.pool.submit(tracer.bind(self.export_format), fmt, path, content, restored["hash"])
+                for fmt in self.formats]
+        for job in jobs:
+            job.result()
+        return restored
 
     def upload_to_cloud(self, file_path):
         """Upload export to cloud storage (stub)."""
@@ -71,10 +189,11 @@ class ExportAgent:
         # TODO: Use cryptography library for optional encryption
         pass
 
-    def log_export(self, file_path):
-        """Log export details (stub)."""
-        # TODO: Write export details to a log file or database
-        pass
+    def log_export(self, file_path, results):
+        """Append export details to export_log.jsonl."""
+        record = {"timestamp": datetime.now().isoformat(), "file": file_path, "results": results}
+        with open(os.path.join(self.export_dir, "export_log.jsonl"), "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
 
     def send_notification(self, file_path):
         """Send notification after export (stub)."""
@@ -100,11 +219,14 @@ class ExportAgent:
                 content="Expected final_readme message."
             )
 
-        saved_path = self.save_readme(message.content)
+        saved_path, results = self.save_readme(message.content)
+        outputs = [results[fmt]["path"] for fmt in self.formats if results[fmt]["path"]]
+        version = results["version"]["version"]
 
         return A2AMessage(
             from_agent="ExportAgent",
             to_agent="UI",
             message_type="readme_saved",
-            content=f"README saved to: {saved_path}"
+            content=f"README saved to: {saved_path} (version {version})"
+                    + (f", also exported: {', '.join(outputs)}" if outputs else "")
         )
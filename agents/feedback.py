@@ -1,5 +1,6 @@
 from core.adk_agent import ADK
 from core.a2a_protocol import A2AMessage
+from core.telemetry import tracer
 
 
 class FeedbackAgent(ADK):
@@ -21,8 +22,8 @@ class FeedbackAgent(ADK):
     # - Allow feedback on specific README sections.
     # - Output a changelog of README edits.
     #
-    def __init__(self):
-        super().__init__()
+    def __init__(self, model=None):
+        super().__init__(model=model)
 
     def build_feedback_prompt(self, original_readme: str, user_feedback: str) -> str:
         return f"""
@@ -51,8 +52,10 @@ You are an AI README editor. Your task is to update the original README based on
                 content="Expected a previous README message."
             )
 
-        prompt = self.build_feedback_prompt(previous_msg.content, feedback_text)
-        updated_readme = self.generate(prompt)
+        with tracer.span("feedback.run"):
+            with tracer.span("feedback.build_prompt"):
+                prompt = self.build_feedback_prompt(previous_msg.content, feedback_text)
+            updated_readme = self.generate(prompt)
 
         return A2AMessage(
             from_agent="FeedbackAgent",
@@ -1,6 +1,8 @@
 import base64
-import requests
+import hashlib
 from core.a2a_protocol import A2AMessage
+from core.http_client import GitHubClient, GITHUB_API_URL
+from core.telemetry import tracer
 
 class GitHubPushAgent:
 
@@ -21,47 +23,171 @@ class GitHubPushAgent:
     # - Provide a push log and status dashboard.
     # - Optionally support pushing other documentation files.
     #
-    def __init__(self, github_token):
+    def __init__(self, github_token, api_url=GITHUB_API_URL, client=None):
         self.token = github_token
-        self.headers = {
-            "Authorization": f"token {self.token}",
-            "Accept": "application/vnd.github.v3+json"
-        }
-
-    def get_repo_file_sha(self, owner, repo, path):
-        url = f"https://api.github.com/repos/{owner}/{repo}/contents/{path}"
-        response = requests.get(url, headers=self.headers)
+        self.client = client or GitHubClient(github_token, base_url=api_url)
+        # SHA of each file we last wrote, so the next update can skip the lookup GET
+        self._known_shas = {}
+
+    @staticmethod
+    def parse_repo_url(github_url):
+        parts = github_url.strip().rstrip("/").replace("https://github.com/", "").split("/")
+        owner, repo = parts[0], parts[1]
+        if repo.endswith(".git"):
+            repo = repo[:-4]
+        return owner, repo
+
+    def get_repo_file_sha(self, owner, repo, path, branch="main", use_cache=True):
+        response = self.client.get(f"repos/{owner}/{repo}/contents/{path}",
+                                   params={"ref": branch}, use_cache=use_cache)
         if response.status_code == 200:
             return response.json().get("sha")
         return None  # File does not exist yet
 
-    def push_readme(self, github_url, readme_text, commit_message="🤖 Auto-generated README"):
+    def push_readme(self, github_url, readme_text, commit_message="🤖 Auto-generated README", branch="main"):
         try:
-            parts = github_url.replace("https://github.com/", "").split("/")
-            owner, repo = parts[0], parts[1]
+            owner, repo = self.parse_repo_url(github_url)
 
             path = "README.md"
-            url = f"https://api.github.com/repos/{owner}/{repo}/contents/{path}"
-            sha = self.get_repo_file_sha(owner, repo, path)
+            key = (owner, repo, branch, path)
+            sha = self._known_shas.get(key) or self.get_repo_file_sha(owner, repo, path, branch)
 
             data = {
                 "message": commit_message,
                 "content": base64.b64encode(readme_text.encode("utf-8")).decode("utf-8"),
-                "branch": "main"  # or "master"
+                "branch": branch
             }
             if sha:
                 data["sha"] = sha
 
-            response = requests.put(url, headers=self.headers, json=data)
+            url = f"repos/{owner}/{repo}/contents/{path}"
+            response = self.client.put(url, json=data)
+            if response.status_code in [409, 422] and sha:
+                # Our SHA is stale (someone else pushed); look it up fresh and try once more
+                self._known_shas.pop(key, None)
+                data["sha"] = self.get_repo_file_sha(owner, repo, path, branch, use_cache=False)
+                response = self.client.put(url, json=data)
 
             if response.status_code in [200, 201]:
+                self._known_shas[key] = response.json().get("content", {}).get("sha")
+                self.client.invalidate(url)
                 return f"✅ README pushed to GitHub: {github_url}"
             else:
                 return f"❌ GitHub push failed: {response.status_code} - {response.text}"
         except Exception as e:
             return f"❌ Exception during GitHub push: {e}"
 
-    def run(self, github_url, message: A2AMessage):
+    @staticmethod
+    def git_blob_sha(data: bytes):
+        """SHA git assigns to a blob with this content, used to diff against the remote tree."""
+        return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+    def get_default_branch(self, owner, repo):
+        response = self.client.get(f"repos/{owner}/{repo}")
+        response.raise_for_status()
+        return response.json()["default_branch"]
+
+    @staticmethod
+    def _pr_already_exists(response):
+        """True if a 422 from POST /pulls means an open PR already exists for the branch."""
+        try:
+            errors = response.json().get("errors", [])
+        except ValueError:
+            return False
+        return any("already exists" in str(error.get("message", "")) for error in errors if isinstance(error, dict))
+
+    def push_files(self, github_url, files, commit_message="🤖 Auto-generated docs", branch=None,
+                   base_branch=None, open_pr=False, pr_title=None, pr_body=""):
+        """Push many files as a single commit through the Git Data API.
+
+        files maps repo paths to str or bytes. Files whose blob SHA already
+        matches the remote tree are left out, and nothing is committed if all
+        of them are unchanged. Text files are sent inline with the tree, so the
+        number of API calls does not grow with the file count; only binary
+        files (PDF, images) need a blob upload each.
+        """
+        try:
+            owner, repo = self.parse_repo_url(github_url)
+            api = f"repos/{owner}/{repo}"
+            base_branch = base_branch or self.get_default_branch(owner, repo)
+            branch = branch or base_branch
+
+            new_branch = False
+            response = self.client.get(f"{api}/git/ref/heads/{branch}")
+            if response.status_code == 404 and branch != base_branch:
+                new_branch = True
+                response = self.client.get(f"{api}/git/ref/heads/{base_branch}")
+            response.raise_for_status()
+            parent_sha = response.json()["object"]["sha"]
+
+            # Commits and trees are immutable, so these GETs are ETag-cache friendly
+            # Commits and trees are addressed by SHA and never change; no point caching their ETags
+            response = self.client.get(f"{api}/git/commits/{parent_sha}", use_cache=False)
+            response.raise_for_status()
+            base_tree = response.json()["tree"]["sha"]
+            response = self.client.get(f"{api}/git/trees/{base_tree}", params={"recursive": "1"}, use_cache=False)
+            response.raise_for_status()
+            remote = {e["path"]: e["sha"] for e in response.json().get("tree", []) if e["type"] == "blob"}
+
+            entries = []
+            for path, data in files.items():
+                raw = data.encode("utf-8") if isinstance(data, str) else data
+                if remote.get(path) == self.git_blob_sha(raw):
+                    continue
+                entry = {"path": path, "mode": "100644", "type": "blob"}
+                try:
+                    entry["content"] = raw.decode("utf-8")
+                except UnicodeDecodeError:
+                    blob = self.client.post(f"{api}/git/blobs", json={
+                        "content": base64.b64encode(raw).decode("utf-8"),
+                        "encoding": "base64"
+                    })
+                    blob.raise_for_status()
+                    entry["sha"] = blob.json()["sha"]
+                entries.append(entry)
+
+            if not entries:
+                return f"✅ Already up to date on {branch}: {github_url}"
+
+            response = self.client.post(f"{api}/git/trees", json={"base_tree": base_tree, "tree": entries})
+            response.raise_for_status()
+            response = self.client.post(f"{api}/git/commits", json={
+                "message": commit_message,
+                "tree": response.json()["sha"],
+                "parents": [parent_sha]
+            })
+            response.raise_for_status()
+            commit_sha = response.json()["sha"]
+
+            if new_branch:
+                response = self.client.post(f"{api}/git/refs", json={"ref": f"refs/heads/{branch}", "sha": commit_sha})
+            else:
+                response = self.client.patch(f"{api}/git/refs/heads/{branch}", json={"sha": commit_sha, "force": False})
+            if response.status_code not in [200, 201]:
+                return f"❌ GitHub push failed: {response.status_code} - {response.text}"
+            self.client.invalidate(f"{api}/git/ref/heads/{branch}")
+
+            status = f"✅ Pushed {len(entries)} of {len(files)} file(s) to {branch}: {github_url}"
+            if open_pr and branch == base_branch:
+                status += f"\nℹ️ No pull request opened: {branch} is the default branch. Set a different target branch to open one."
+            elif open_pr:
+                response = self.client.post(f"{api}/pulls", json={
+                    "title": pr_title or commit_message,
+                    "head": branch,
+                    "base": base_branch,
+                    "body": pr_body
+                })
+                if response.status_code == 201:
+                    status += f"\n🔀 Pull request opened: {response.json()['html_url']}"
+                elif response.status_code == 422 and self._pr_already_exists(response):
+                    status += "\n🔀 A pull request for this branch is already open."
+                else:
+                    status += f"\n❌ Pull request failed: {response.status_code} - {response.text}"
+            return status
+        except Exception as e:
+            return f"❌ Exception during GitHub push: {e}"
+
+    def run(self, github_url, message: A2AMessage, extra_files=None, branch=None, open_pr=False):
         if message.message_type != "final_readme":
             return A2AMessage(
                 from_agent="GitHubPushAgent",
@@ -70,7 +196,11 @@ class GitHubPushAgent:
                 content="Expected final_readme message."
             )
 
-        result = self.push_readme(github_url, message.content)
+        files = {"README.md": message.content}
+        files.update(extra_files or {})
+        with tracer.span("github.push_files", files=len(files)):
+            result = self.push_files(github_url, files, commit_message="🤖 Auto-generated README",
+                                     branch=branch, open_pr=open_pr)
         return A2AMessage(
             from_agent="GitHubPushAgent",
             to_agent="UI",
@@ -1,10 +1,14 @@
 import os
-from core.adk_agent import ADK
+from core.adk_agent import ADK, record_usage
+from core.telemetry import tracer
 from core.a2a_protocol import A2AMessage
 import google.generativeai as genai
 from PIL import Image
 
 
+IMAGE_ERROR_PREFIX = "❌ Error analyzing image: "
+
+
 class VisionAgent(ADK):
 
     # --- AGENT ROLE PROMPT ---
@@ -24,7 +28,10 @@ class VisionAgent(ADK):
     # - Integrate with cloud storage for image uploads.
     # - Output a visual changelog if diagrams change over time.
     #
-    def __init__(self, model_name="gemini-2.5-flash"):
+    def __init__(self, model_name="gemini-2.5-flash", model=None):
+        if model is not None:
+            self.model = model
+            return
         self.api_key = os.getenv("GOOGLE_API_KEY")
         if not self.api_key:
             raise ValueError(" GOOGLE_API_KEY environment variable not set.")
@@ -32,15 +39,30 @@ class VisionAgent(ADK):
         self.model = genai.GenerativeModel(model_name)
 
     def analyze_image(self, image_file, context_prompt="Analyze the following system diagram and provide a detailed explanation. Describe the main components, their interactions, and the overall architecture of the system."):
-        try:
-            image = Image.open(image_file)
-            response = self.model.generate_content([context_prompt, image])
-            return response.text.strip()
-        except Exception as e:
-            return f"❌ Error analyzing image: {e}"
+        with tracer.span("vision.analyze_image") as span:
+            try:
+                image = Image.open(image_file)
+                response = self.model.generate_content([context_prompt, image])
+                text = response.text.strip()
+            except Exception as e:
+                tracer.incr("llm_errors")
+                return f"{IMAGE_ERROR_PREFIX}{e}"
+            if tracer.enabled:
+                span.set(image_size=list(image.size), prompt_chars=len(context_prompt), response_chars=len(text))
+                tracer.incr("llm_prompt_chars", len(context_prompt))
+                tracer.incr("llm_response_chars", len(text))
+                record_usage(span, response)
+            return text
 
     def run(self, image_file, previous_readme_msg: A2AMessage):
         vision_section = self.analyze_image(image_file)
+        if vision_section.startswith(IMAGE_ERROR_PREFIX):
+            return A2AMessage(
+                from_agent="VisionAgent",
+                to_agent="UI",
+                message_type="error",
+                content=vision_section
+            )
 
         enhanced_readme = previous_readme_msg.content + f"\n\n---\n\n🧭 **System Overview**\n{vision_section}"
 
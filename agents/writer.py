@@ -1,5 +1,6 @@
-from core.adk_agent import ADK
+from core.adk_agent import ADK, is_generation_error
 from core.a2a_protocol import A2AMessage
+from core.telemetry import tracer
 
 class WriterAgent(ADK):
 
@@ -23,8 +24,8 @@ class WriterAgent(ADK):
     # - Support for internationalization (i18n) of README content.
     # - Output a summary of README improvements over previous versions.
     #
-    def __init__(self):
-        super().__init__()
+    def __init__(self, model=None):
+        super().__init__(model=model)
 
 
     def build_prompt(self, repo_summary: str, customizations: dict) -> str:
@@ -67,8 +68,18 @@ You are an expert open-source documentation AI. Generate a world-class, project-
                 content="WriterAgent only handles 'repo_summary' messages."
             )
 
-        prompt = self.build_prompt(incoming_message.content, customizations)
-        readme_text = self.generate(prompt)
+        with tracer.span("writer.run"):
+            with tracer.span("writer.build_prompt"):
+                prompt = self.build_prompt(incoming_message.content, customizations)
+            readme_text = self.generate(prompt)
+
+        if is_generation_error(readme_text):
+            return A2AMessage(
+                from_agent="WriterAgent",
+                to_agent="UI",
+                message_type="error",
+                content=readme_text
+            )
 
         return A2AMessage(
             from_agent="WriterAgent",
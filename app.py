@@ -9,6 +9,9 @@ from agents.vision import VisionAgent
 from agents.feedback import FeedbackAgent
 from agents.exporter import ExportAgent
 from agents.push_to_github import GitHubPushAgent
+from core.journal import MessageJournal
+from core.telemetry import Tracer, activate
+import hashlib
 import os
 
 analyzer = AnalyzerAgent()
@@ -18,6 +21,8 @@ feedback = FeedbackAgent()
 exporter = ExportAgent()
 github_token = os.getenv("GITHUB_TOKEN")
 pusher = GitHubPushAgent(github_token)
+JOURNAL_DIR = os.getenv("JOURNAL_DIR", ".journal")
+JOURNAL_MAX_AGE = float(os.getenv("JOURNAL_MAX_AGE", 3600))  # seconds before an interrupted run is abandoned
 
 st.set_page_config(page_title="AI README Generator", layout="wide")
 
@@ -56,6 +61,11 @@ st.caption("Generate beautiful, smart READMEs for any GitHub repo using a team o
 
 if 'global_state' not in st.session_state:
     st.session_state['global_state'] = {}
+# Each browser session gets its own tracer; agents report to whichever is active
+if 'tracer' not in st.session_state:
+    st.session_state['tracer'] = Tracer()
+tracer = st.session_state['tracer']
+activate(tracer)
 
 with st.sidebar:
     st.image("https://github.githubassets.com/images/modules/logos_page/GitHub-Mark.png", width=60)
@@ -73,11 +83,14 @@ with st.sidebar:
         }
     st.header("3️⃣ Actions")
     gen_btn = st.button("🚀 Generate README", use_container_width=True)
+    tracer.enabled = st.checkbox("⏱️ Collect pipeline timings", tracer.enabled, help="Record per-agent timings, token counts and cache hits.")
     st.divider()
     st.header("4️⃣ Feedback & Export")
     feedback_text = st.text_area("Feedback or Edit", help="Suggest improvements or edit the README.")
     regen_btn = st.button("🔁 Regenerate with Feedback", use_container_width=True)
     export_btn = st.button("💾 Export Final README", use_container_width=True)
+    push_branch = st.text_input("Target Branch", placeholder="default branch", help="Branch to push to. A new branch is created from the default branch if needed.")
+    open_pr = st.checkbox("Open a pull request", False, help="Open a PR from the target branch into the default branch.")
     push_btn = st.button("🚀 Push to GitHub", use_container_width=True)
 
 # --- Progress Bar ---
@@ -126,26 +139,59 @@ with cols[1]:
         "✅" if 'final_readme' in st.session_state['global_state'] and feedback_text else "⬜",
         "✅" if 'final_readme' in st.session_state['global_state'] else "⬜"
     ), unsafe_allow_html=True)
+    if tracer.enabled and tracer.spans:
+        with st.expander("⏱️ Timing Breakdown", expanded=True):
+            st.dataframe(
+                [{"Step": row["name"], "Calls": row["count"], "Total (ms)": round(row["total_ms"], 1)}
+                 for row in tracer.summary()],
+                hide_index=True, use_container_width=True
+            )
+            counters = {name: value for (name, labels), value in tracer.counters.items() if not labels}
+            for name in ["llm_prompt_tokens", "llm_response_tokens", "llm_prompt_chars", "llm_response_chars", "bytes_cloned"]:
+                if name in counters:
+                    st.caption(f"{name.replace('_', ' ')}: {int(counters[name]):,}")
+            for cache_name, rate in sorted(tracer.cache_hit_rates().items()):
+                st.caption(f"{cache_name} cache hit rate: {rate:.0%}")
+            st.download_button("⬇️ Traces (JSON lines)", tracer.to_jsonl(), file_name="traces.jsonl", use_container_width=True)
+            st.download_button("⬇️ Metrics (Prometheus)", tracer.prometheus_text(), file_name="metrics.prom", use_container_width=True)
 
 # --- Main Actions ---
 if gen_btn:
     if github_url:
         with st.spinner("Analyzing repository and generating README..."):
+            tracer.reset()
             try:
-                analysis_msg = analyzer.run(github_url)
-                st.session_state['global_state']["analyzer_msg"] = analysis_msg
                 customizations = {
                     "template": readme_template,
                     "sections": [section for section, included in include_sections.items() if included]
                 }
-                readme_msg = writer.run(analysis_msg, customizations)
+                # Resume an interrupted run from its journal instead of re-cloning/re-prompting
+                image_hash = hashlib.sha256(image_file.getvalue()).hexdigest() if image_file else None
+                journal = MessageJournal.for_run(
+                    JOURNAL_DIR, github_url, customizations, image_hash, max_age=JOURNAL_MAX_AGE
+                )
+                journaled = journal.latest_by_type()
+
+                def run_step(message_type, produce):
+                    if message_type in journaled:
+                        return journaled[message_type]
+                    message = produce()
+                    if message.message_type == "error":
+                        # Never journal a failed step, so the next attempt retries it
+                        raise RuntimeError(message.content)
+                    return journal.append(message)
+
+                analysis_msg = run_step("repo_summary", lambda: analyzer.run(github_url))
+                st.session_state['global_state']["analyzer_msg"] = analysis_msg
+                readme_msg = run_step("readme_draft", lambda: writer.run(analysis_msg, customizations))
                 st.session_state['global_state']["writer_msg"] = readme_msg
                 if image_file:
-                    vision_msg = vision.run(image_file, readme_msg)
+                    vision_msg = run_step("readme_with_vision", lambda: vision.run(image_file, readme_msg))
                     st.session_state['global_state']["vision_msg"] = vision_msg
                     st.session_state['global_state']['final_readme'] = vision_msg.content
                 else:
                     st.session_state['global_state']['final_readme'] = readme_msg.content
+                journal.clear()
                 st.rerun()
             except Exception as e:
                 st.error(f"❌ Error: {e}")
@@ -177,8 +223,17 @@ if push_btn:
     if 'final_readme' in st.session_state['global_state'] and github_url:
         with st.spinner("Pushing README to GitHub..."):
             from core.a2a_protocol import A2AMessage
-            final_msg = A2AMessage("UI", "GitHubPushAgent", "final_readme", st.session_state['global_state']['final_readme'])
-            response = pusher.run(github_url, final_msg)
+            final_readme = st.session_state['global_state']['final_readme']
+            final_msg = A2AMessage("UI", "GitHubPushAgent", "final_readme", final_readme)
+            # Ship the diagram and any HTML/PDF exports of this README in the same commit
+            extra_files = {}
+            if image_file:
+                extra_files[f"docs/{image_file.name}"] = image_file.getvalue()
+            for path in exporter.exported_files(final_readme).values():
+                with open(path, "rb") as f:
+                    extra_files[f"docs/{os.path.basename(path)}"] = f.read()
+            response = pusher.run(github_url, final_msg, extra_files=extra_files,
+                                  branch=push_branch or None, open_pr=open_pr)
             st.info(response.content)
     else:
         st.warning("No final README to push or GitHub URL provided.")
@@ -0,0 +1,46 @@
+import hashlib
+import time
+
+
+class FakeUsage:
+    def __init__(self, prompt_token_count, candidates_token_count):
+        self.prompt_token_count = prompt_token_count
+        self.candidates_token_count = candidates_token_count
+
+
+class FakeResponse:
+    def __init__(self, text, usage_metadata):
+        self.text = text
+        self.usage_metadata = usage_metadata
+
+
+class FakeModel:
+    """Deterministic stand-in for genai.GenerativeModel.
+
+    The reply depends only on the prompt, so runs are reproducible; latency
+    (seconds per call) and the reply size are configurable. Token counts use
+    the rough 4-characters-per-token rule.
+    """
+
+    def __init__(self, latency=0.0, response_chars=4000):
+        self.latency = latency
+        self.response_chars = response_chars
+        self.calls = 0
+
+    def generate_content(self, prompt):
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        parts = prompt if isinstance(prompt, list) else [prompt]
+        text_in = "".join(p for p in parts if isinstance(p, str))
+        seed = hashlib.sha256(text_in.encode("utf-8")).hexdigest()
+
+        lines = ["# Synthetic Project", ""]
+        i = 0
+        while sum(len(line) + 1 for line in lines) < self.response_chars:
+            lines.append(f"## Section {i}")
+            lines.append(f"Generated paragraph {i} for prompt {seed[:12]}. " * 3)
+            lines.append("")
+            i += 1
+        text = "\n".join(lines)[:self.response_chars]
+        return FakeResponse(text, FakeUsage(len(text_in) // 4, len(text) // 4))
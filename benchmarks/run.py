@@ -0,0 +1,285 @@
+"""Offline benchmarks for the README pipeline.
+
+Generates a synthetic git repository, plugs a deterministic FakeModel into
+the LLM agents and measures the AnalyzerAgent detectors, prompt building and
+the end-to-end pipeline. Each scenario runs in a fresh process so its peak
+RSS is its own; peak RSS is therefore reported per scenario, not per
+benchmark. No network access or API key is needed.
+
+    python -m benchmarks.run --files 1000 --latency 0.05 --output bench.json
+    python -m benchmarks.run --output new.json --compare bench.json
+"""
+import argparse
+import io
+import json
+import math
+import multiprocessing
+import os
+import platform
+import queue
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+from datetime import datetime
+
+DETECTORS = [
+    "extract_structure", "detect_languages", "extract_dependencies", "detect_cicd",
+    "detect_docker", "detect_badges", "detect_api_endpoints", "detect_tests",
+]
+
+
+def percentile(samples, p):
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+
+def summarize(samples, units=1):
+    """Latency stats in ms; throughput is units processed per second at the mean latency."""
+    mean = sum(samples) / len(samples)
+    return {
+        "runs": len(samples),
+        "mean_ms": round(mean * 1000, 3),
+        "p50_ms": round(percentile(samples, 50) * 1000, 3),
+        "p95_ms": round(percentile(samples, 95) * 1000, 3),
+        "throughput_per_s": round(units / mean, 3) if mean else None,
+    }
+
+
+def timed(fn, repeat, warmup=1):
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def make_repo(cfg, workdir):
+    from benchmarks.synthetic_repo import generate_repo
+    return generate_repo(
+        os.path.join(workdir, "repo"), files=cfg["files"], depth=cfg["depth"],
+        languages=cfg["languages"], manifest_deps=cfg["manifest_deps"],
+        lockfile_entries=cfg["lockfile_entries"], route_density=cfg["route_density"], seed=cfg["seed"],
+    )
+
+
+def make_image():
+    from PIL import Image
+    buf = io.BytesIO()
+    Image.new("RGB", (640, 480), "white").save(buf, format="PNG")
+    buf.seek(0)
+    return buf
+
+
+def bench_detectors(cfg, workdir):
+    from agents.analyzer import AnalyzerAgent
+    repo = make_repo(cfg, workdir)
+    agent = AnalyzerAgent()
+    return {
+        f"analyzer.{name}": summarize(timed(lambda: getattr(agent, name)(repo), cfg["repeat"]), units=cfg["files"])
+        for name in DETECTORS
+    }
+
+
+def bench_prompt(cfg, workdir):
+    from agents.analyzer import AnalyzerAgent
+    from agents.writer import WriterAgent
+    from benchmarks.fake_llm import FakeModel
+    repo = make_repo(cfg, workdir)
+    summary = AnalyzerAgent().run(repo).content
+    writer = WriterAgent(model=FakeModel())
+    customizations = {"template": "Detailed", "sections": ["Installation", "Usage", "Contributing", "License"]}
+    return {
+        "writer.build_prompt": summarize(
+            timed(lambda: writer.build_prompt(summary, customizations), cfg["repeat"] * 10)
+        ),
+    }
+
+
+def bench_pipeline(cfg, workdir):
+    from agents.analyzer import AnalyzerAgent
+    from agents.writer import WriterAgent
+    from agents.vision import VisionAgent
+    from agents.feedback import FeedbackAgent
+    from agents.exporter import ExportAgent
+    from core.a2a_protocol import A2AMessage
+    from benchmarks.fake_llm import FakeModel
+
+    repo = make_repo(cfg, workdir)
+    model = FakeModel(latency=cfg["latency"], response_chars=cfg["response_chars"])
+    analyzer = AnalyzerAgent()
+    writer = WriterAgent(model=model)
+    vision = VisionAgent(model=model)
+    feedback = FeedbackAgent(model=model)
+    exporter = ExportAgent(os.path.join(workdir, "exports"))
+    customizations = {"template": "Detailed", "sections": ["Installation", "Usage"]}
+
+    def pipeline():
+        analysis = analyzer.run(repo)
+        draft = writer.run(analysis, customizations)
+        with_vision = vision.run(make_image(), draft)
+        final = feedback.run("Make it shorter.", with_vision)
+        exporter.run(A2AMessage("UI", "ExportAgent", "final_readme", final.content))
+
+    return {"pipeline.end_to_end": summarize(timed(pipeline, cfg["repeat"]))}
+
+
+SCENARIOS = {
+    "detectors": bench_detectors,
+    "prompt": bench_prompt,
+    "pipeline": bench_pipeline,
+}
+
+
+def _scenario_worker(name, cfg, outbox):
+    workdir = tempfile.mkdtemp(prefix=f"bench-{name}-")
+    tempfile.tempdir = workdir  # AnalyzerAgent clones into mkdtemp(); keep them inside workdir
+    try:
+        results = SCENARIOS[name](cfg, workdir)
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform == "darwin":
+            peak //= 1024  # bytes on macOS, KiB elsewhere
+        outbox.put({"results": results, "peak_rss_kb": peak})
+    except BaseException:
+        outbox.put({"error": traceback.format_exc()})
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def run_scenario(name, cfg):
+    """Run one scenario in a fresh spawned process; worker errors are re-raised here."""
+    ctx = multiprocessing.get_context("spawn")
+    outbox = ctx.Queue()
+    proc = ctx.Process(target=_scenario_worker, args=(name, cfg, outbox))
+    proc.start()
+    deadline = time.monotonic() + cfg["timeout"]
+    try:
+        while True:
+            try:
+                outcome = outbox.get(timeout=0.5)
+                break
+            except queue.Empty:
+                if not proc.is_alive():
+                    # Died without reporting (e.g. killed); one last look in case the put raced the exit
+                    try:
+                        outcome = outbox.get(timeout=0.5)
+                        break
+                    except queue.Empty:
+                        raise RuntimeError(f"Scenario {name} exited with code {proc.exitcode}") from None
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Scenario {name} did not finish within {cfg['timeout']}s")
+    finally:
+        if proc.is_alive():
+            proc.terminate()
+        proc.join()
+    if "error" in outcome:
+        raise RuntimeError(f"Scenario {name} failed:\n{outcome['error']}")
+    return outcome
+
+
+def git_commit():
+    try:
+        sha = subprocess.check_output(["git", "rev-parse", "HEAD"], text=True, stderr=subprocess.DEVNULL).strip()
+        dirty = bool(subprocess.check_output(["git", "status", "--porcelain", "-uno"], text=True).strip())
+        return sha + ("-dirty" if dirty else "")
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current, baseline):
+    lines = [f"{'benchmark':<34} {'base p50':>10} {'new p50':>10} {'change':>8}"]
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if not base:
+            lines.append(f"{name:<34} {'-':>10} {result['p50_ms']:>10.2f} {'new':>8}")
+            continue
+        change = (result["p50_ms"] - base["p50_ms"]) / base["p50_ms"] * 100 if base["p50_ms"] else 0.0
+        lines.append(f"{name:<34} {base['p50_ms']:>10.2f} {result['p50_ms']:>10.2f} {change:>+7.1f}%")
+
+    lines.append("")
+    lines.append(f"{'scenario peak RSS (KiB)':<34} {'base':>10} {'new':>10} {'change':>8}")
+    for name, scenario in current["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(name)
+        new_rss = scenario["peak_rss_kb"]
+        if not base:
+            lines.append(f"{name:<34} {'-':>10} {new_rss:>10} {'new':>8}")
+            continue
+        change = (new_rss - base["peak_rss_kb"]) / base["peak_rss_kb"] * 100
+        lines.append(f"{name:<34} {base['peak_rss_kb']:>10} {new_rss:>10} {change:>+7.1f}%")
+    return "\n".join(lines)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Offline benchmarks for the README pipeline.")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="Comma-separated subset of: " + ", ".join(SCENARIOS))
+    parser.add_argument("--files", type=int, default=500, help="Files in the synthetic repo.")
+    parser.add_argument("--depth", type=int, default=4, help="Maximum directory depth.")
+    parser.add_argument("--languages", default="py=5,js=3,md=2", help="Language mix as ext=weight pairs.")
+    parser.add_argument("--manifest-deps", type=int, default=50, help="Dependencies per manifest.")
+    parser.add_argument("--lockfile-entries", type=int, default=2000, help="Entries in package-lock.json.")
+    parser.add_argument("--route-density", type=float, default=0.05, help="Fraction of source lines that are API routes.")
+    parser.add_argument("--latency", type=float, default=0.0, help="Fake model latency per call, in seconds.")
+    parser.add_argument("--response-chars", type=int, default=4000, help="Fake model reply size.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per benchmark.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=1800, help="Seconds to wait for each scenario.")
+    parser.add_argument("--output", help="Write JSON results here instead of stdout.")
+    parser.add_argument("--compare", help="Baseline JSON results to compare against.")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    languages = {}
+    for pair in args.languages.split(","):
+        ext, _, weight = pair.partition("=")
+        languages[ext.strip()] = float(weight or 1)
+    cfg = {
+        "files": args.files, "depth": args.depth, "languages": languages,
+        "manifest_deps": args.manifest_deps, "lockfile_entries": args.lockfile_entries,
+        "route_density": args.route_density, "latency": args.latency,
+        "response_chars": args.response_chars, "repeat": args.repeat, "seed": args.seed,
+        "timeout": args.timeout,
+    }
+
+    results, scenarios = {}, {}
+    for name in args.scenarios.split(","):
+        name = name.strip()
+        if name not in SCENARIOS:
+            raise SystemExit(f"Unknown scenario: {name}")
+        print(f"Running {name}...", file=sys.stderr)
+        outcome = run_scenario(name, cfg)
+        results.update(outcome["results"])
+        scenarios[name] = {"peak_rss_kb": outcome["peak_rss_kb"], "benchmarks": sorted(outcome["results"])}
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "config": cfg,
+        },
+        "scenarios": scenarios,
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            print(compare(report, json.load(f)), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
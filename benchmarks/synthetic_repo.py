@@ -0,0 +1,75 @@
+import json
+import os
+import random
+from git import Repo
+
+# Extension -> (route line template, plain line template)
+LANGUAGES = {
+    "py": ("@app.route('/api/{name}')", "def {name}():\n    return {n}\n"),
+    "js": ("app.get('/api/{name}', handler)", "function {name}() {{ return {n}; }}\n"),
+    "ts": ("router.get('/api/{name}', handler)", "export const {name} = () => {n};\n"),
+    "go": ("// no routes", "func {name}() int {{ return {n} }}\n"),
+    "md": ("[{name}](https://img.shields.io/badge/{name}-ok-green)", "Notes about {name}.\n"),
+}
+
+
+def generate_repo(dest, files=200, depth=3, languages=None, manifest_deps=30, lockfile_entries=300,
+                  route_density=0.1, lines_per_file=40, seed=0):
+    """Create a git repository with the requested shape and return its path.
+
+    languages maps extension -> weight, route_density is the fraction of lines
+    in source files that look like API routes. The same arguments always give
+    the same tree.
+    """
+    rng = random.Random(seed)
+    languages = languages or {"py": 0.5, "js": 0.3, "md": 0.2}
+    exts = list(languages)
+    weights = [languages[e] for e in exts]
+    os.makedirs(dest, exist_ok=True)
+
+    dirs = [""]
+    for i in range(max(1, files // 10)):
+        parent = rng.choice(dirs)
+        if parent.count(os.sep) + 1 < depth:
+            dirs.append(os.path.join(parent, f"pkg{i}") if parent else f"pkg{i}")
+
+    for i in range(files):
+        ext = rng.choices(exts, weights)[0]
+        route, plain = LANGUAGES.get(ext, LANGUAGES["py"])
+        prefix = "test_" if rng.random() < 0.1 else ""
+        rel = os.path.join(rng.choice(dirs), f"{prefix}module_{i}.{ext}")
+        lines = []
+        for n in range(lines_per_file):
+            template = route if rng.random() < route_density else plain
+            lines.append(template.format(name=f"f{i}_{n}", n=n))
+        _write(dest, rel, "\n".join(lines))
+
+    deps = [f"package-{i}" for i in range(manifest_deps)]
+    _write(dest, "requirements.txt", "\n".join(f"{d}=={i % 9}.{i % 7}.0" for i, d in enumerate(deps)))
+    _write(dest, "package.json", json.dumps({
+        "name": "synthetic",
+        "dependencies": {d: f"^{i % 9}.0.0" for i, d in enumerate(deps)}
+    }, indent=2))
+    _write(dest, "package-lock.json", json.dumps({
+        "lockfileVersion": 3,
+        "packages": {f"node_modules/lock-{i}": {
+            "version": f"{i % 9}.{i % 5}.{i % 3}",
+            "integrity": f"sha512-{rng.getrandbits(256):064x}"
+        } for i in range(lockfile_entries)}
+    }, indent=2))
+    _write(dest, "Dockerfile", "FROM python:3.11-slim\nCOPY . /app\n")
+    _write(dest, ".gitlab-ci.yml", "test:\n  script: pytest\n")
+    _write(dest, "README.md", "# Synthetic\n![build](https://img.shields.io/badge/build-passing-green)\n")
+
+    repo = Repo.init(dest)
+    repo.git.add(A=True)
+    repo.git.execute(["git", "-c", "user.name=bench", "-c", "user.email=bench@example.com",
+                      "commit", "-q", "--no-gpg-sign", "-m", "synthetic"])
+    return dest
+
+
+def _write(root, rel, text):
+    path = os.path.join(root, rel)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
@@ -1,7 +1,15 @@
+import base64
 import json
+import zlib
 from datetime import datetime
 import uuid
 
+# Content larger than this (in bytes) is zlib-compressed when a compressed
+# serialization is requested. Small payloads are left alone since base64
+# overhead would outweigh the savings.
+COMPRESS_THRESHOLD = 4096
+
+
 class A2AMessage:
     def __init__(self, from_agent, to_agent, message_type, content):
         self.from_agent = from_agent
@@ -11,28 +19,46 @@ class A2AMessage:
         self.timestamp = datetime.now().isoformat()
         self.message_id = str(uuid.uuid4())
 
-        def to_dict(self):
-            return {
-                "timestamp": self.timestamp,
-                "id": self.id,
-                "from_agent": self.from_agent,
-                "to_agent": self.to_agent,
-                "message":{
-                "type": self.message_type,
-                "content": self.content
-                }
-            }
+    def to_dict(self, compress=False):
+        message = {
+            "type": self.message_type,
+            "content": self.content
+        }
+        if compress and isinstance(self.content, str):
+            raw = self.content.encode("utf-8")
+            if len(raw) > COMPRESS_THRESHOLD:
+                message["encoding"] = "zlib+base64"
+                message["content"] = base64.b64encode(zlib.compress(raw, 6)).decode("ascii")
+        return {
+            "timestamp": self.timestamp,
+            "id": self.message_id,
+            "from_agent": self.from_agent,
+            "to_agent": self.to_agent,
+            "message": message
+        }
 
-    def to_json(self):
-        return json.dumps(self.to_dict(), indent=4)
+    def to_json(self, compress=False, indent=None):
+        """Serialize to JSON. Compact by default; pass indent for a readable dump."""
+        separators = None if indent else (",", ":")
+        return json.dumps(self.to_dict(compress=compress), indent=indent,
+                          separators=separators, ensure_ascii=False)
 
     @staticmethod
     def from_dict(data):
+        content = data["message"]["content"]
+        encoding = data["message"].get("encoding")
+        if encoding == "zlib+base64":
+            try:
+                content = zlib.decompress(base64.b64decode(content)).decode("utf-8")
+            except zlib.error as e:
+                raise ValueError(f"Corrupt compressed message content: {e}") from e
+        elif encoding:
+            raise ValueError(f"Unsupported message encoding: {encoding}")
         message = A2AMessage(
             from_agent=data["from_agent"],
             to_agent=data["to_agent"],
             message_type=data["message"]["type"],
-            content=data["message"]["content"]
+            content=content
         )
         message.timestamp = data["timestamp"]
         message.message_id = data["id"]
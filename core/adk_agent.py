@@ -1,8 +1,33 @@
 import google.generativeai as genai
 import os
+from core.telemetry import tracer
+
+# generate() reports failures in-band with this prefix instead of raising
+GENERATION_ERROR_PREFIX = " Error generating : "
+
+
+def is_generation_error(text):
+    return text.startswith(GENERATION_ERROR_PREFIX)
+
+
+def record_usage(span, response):
+    """Attach token counts from a Gemini response to span and the global counters."""
+    usage = getattr(response, "usage_metadata", None)
+    if usage is None:
+        return
+    prompt_tokens = getattr(usage, "prompt_token_count", 0) or 0
+    response_tokens = getattr(usage, "candidates_token_count", 0) or 0
+    span.set(prompt_tokens=prompt_tokens, response_tokens=response_tokens)
+    tracer.incr("llm_prompt_tokens", prompt_tokens)
+    tracer.incr("llm_response_tokens", response_tokens)
+
 
 class ADK:
-    def __init__(self,model_name="gemini-2.0-flash"):
+    def __init__(self,model_name="gemini-2.0-flash", model=None):
+        if model is not None:
+            # Any object with generate_content(), e.g. the fake backend in benchmarks/
+            self.model = model
+            return
         self.api_key = os.getenv("GOOGLE_API_KEY")
         if not self.api_key:
             raise ValueError("GOOGLE_API_KEY environment variable is not set.")
@@ -10,8 +35,16 @@ class ADK:
         self.model = genai.GenerativeModel(model_name)
 
     def generate(self, prompt:str)->str:
-        try:
-            response = self.model.generate_content(prompt)
-            return response.text.strip()
-        except Exception as e:
-            return f" Error generating : {str(e)}"
+        with tracer.span("llm.generate", agent=type(self).__name__) as span:
+            try:
+                response = self.model.generate_content(prompt)
+                text = response.text.strip()
+            except Exception as e:
+                tracer.incr("llm_errors")
+                return f"{GENERATION_ERROR_PREFIX}{str(e)}"
+            if tracer.enabled:
+                span.set(prompt_chars=len(prompt), response_chars=len(text))
+                tracer.incr("llm_prompt_chars", len(prompt))
+                tracer.incr("llm_response_chars", len(text))
+                record_usage(span, response)
+            return text
@@ -0,0 +1,202 @@
+import random
+import threading
+import time
+from collections import OrderedDict
+import requests
+from requests.adapters import HTTPAdapter
+from core.telemetry import tracer
+
+GITHUB_API_URL = "https://api.github.com"
+
+# Statuses worth retrying: throttling and transient server errors.
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Methods safe to resend after a failure the server may already have acted on.
+# POST/PATCH (new commits, refs, PRs) are only retried when the server
+# explicitly throttled them, i.e. the request was rejected without effect.
+IDEMPOTENT_METHODS = {"GET", "HEAD", "PUT", "DELETE", "OPTIONS"}
+
+
+class GitHubClient:
+    """Shared HTTP session for the GitHub REST API.
+
+    - One pooled requests.Session, so calls reuse keep-alive connections.
+    - Explicit (connect, read) timeouts on every request.
+    - Retries with exponential backoff that honour Retry-After and the
+      X-RateLimit-Remaining / X-RateLimit-Reset headers.
+    - ETag-conditional GETs: a 304 answer is served from the local cache and
+      does not count against the GitHub rate limit. The cache keeps the
+      cache_size most recently used URLs.
+
+    base_url and sleep are injectable so the client can be pointed at a local
+    stub server that simulates throttling.
+    """
+
+    def __init__(self, token=None, base_url=GITHUB_API_URL, timeout=(5, 30), max_retries=4,
+                 backoff=1.0, max_wait=60, pool_size=10, cache_size=256, sleep=time.sleep):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_wait = max_wait
+        self.sleep = sleep
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "Accept": "application/vnd.github.v3+json",
+            "User-Agent": "multi-agent-readme-generator"
+        })
+        if token:
+            self.session.headers["Authorization"] = f"token {token}"
+
+        self.cache_size = cache_size
+        self._etag_cache = OrderedDict()  # (url, params) -> cached 200 response, least recently used first
+        self._cache_lock = threading.Lock()
+        self.rate_limit_remaining = None
+        self.rate_limit_reset = None
+        self.stats = {"requests": 0, "retries": 0, "cache_hits": 0}
+
+    def url(self, path):
+        if path.startswith("http://") or path.startswith("https://"):
+            return path
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    def get(self, path, params=None, use_cache=True, **kwargs):
+        url = self.url(path)
+        if not use_cache:
+            return self.request("GET", url, params=params, **kwargs)
+
+        key = (url, tuple(sorted((params or {}).items())))
+        with self._cache_lock:
+            cached = self._etag_cache.get(key)
+            if cached is not None:
+                self._etag_cache.move_to_end(key)
+        headers = dict(kwargs.pop("headers", None) or {})
+        if cached is not None:
+            headers["If-None-Match"] = cached.headers["ETag"]
+
+        response = self.request("GET", url, params=params, headers=headers, **kwargs)
+        if response.status_code == 304 and cached is not None:
+            self.stats["cache_hits"] += 1
+            tracer.cache("github_etag", hit=True)
+            return cached
+        tracer.cache("github_etag", hit=False)
+        if response.status_code == 200 and response.headers.get("ETag"):
+            with self._cache_lock:
+                self._etag_cache[key] = response
+                self._etag_cache.move_to_end(key)
+                while len(self._etag_cache) > self.cache_size:
+                    self._etag_cache.popitem(last=False)
+        elif response.status_code == 404:
+            with self._cache_lock:
+                self._etag_cache.pop(key, None)
+        return response
+
+    def put(self, path, json=None, **kwargs):
+        return self.request("PUT", self.url(path), json=json, **kwargs)
+
+    def post(self, path, json=None, **kwargs):
+        return self.request("POST", self.url(path), json=json, **kwargs)
+
+    def patch(self, path, json=None, **kwargs):
+        return self.request("PATCH", self.url(path), json=json, **kwargs)
+
+    def invalidate(self, path=None):
+        """Forget cached ETags for one URL (any params), or all of them."""
+        with self._cache_lock:
+            if path is None:
+                self._etag_cache.clear()
+                return
+            url = self.url(path)
+            for key in [k for k in self._etag_cache if k[0] == url]:
+                del self._etag_cache[key]
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        attempt = 0
+        while True:
+            self._wait_for_rate_limit()
+            self.stats["requests"] += 1
+            tracer.incr("github_requests", method=method)
+            try:
+                with tracer.span("github.http", method=method) as span:
+                    response = self.session.request(method, self.url(url), **kwargs)
+                    if tracer.enabled:
+                        span.set(status=response.status_code, bytes=len(response.content))
+            except (requests.ConnectionError, requests.Timeout) as e:
+                # A connect timeout means nothing was sent, so it is safe for any method
+                safe = method in IDEMPOTENT_METHODS or isinstance(e, requests.ConnectTimeout)
+                if attempt >= self.max_retries or not safe:
+                    raise
+                self._retry_sleep(self._backoff_delay(attempt))
+                attempt += 1
+                continue
+
+            self._record_rate_limit(response)
+            if attempt >= self.max_retries or not self._should_retry(method, response):
+                return response
+
+            delay = self._retry_delay(response, attempt)
+            if delay > self.max_wait:
+                return response  # Not worth blocking the UI for; let the caller report it
+            response.close()
+            self._retry_sleep(delay)
+            attempt += 1
+
+    def _should_retry(self, method, response):
+        if response.status_code == 429:
+            return True
+        # GitHub reports primary and secondary rate limits as 403
+        if response.status_code == 403:
+            return ("Retry-After" in response.headers
+                    or response.headers.get("X-RateLimit-Remaining") == "0")
+        return method in IDEMPOTENT_METHODS and response.status_code in RETRY_STATUSES
+
+    def _retry_delay(self, response, attempt):
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                pass
+        if response.headers.get("X-RateLimit-Remaining") == "0":
+            reset = response.headers.get("X-RateLimit-Reset")
+            if reset is not None:
+                try:
+                    return max(0.0, float(reset) - time.time()) + 1
+                except ValueError:
+                    pass
+        return self._backoff_delay(attempt)
+
+    def _backoff_delay(self, attempt):
+        delay = self.backoff * (2 ** attempt)
+        return delay + random.uniform(0, delay / 4)
+
+    def _retry_sleep(self, delay):
+        self.stats["retries"] += 1
+        tracer.incr("github_retries")
+        self.sleep(delay)
+        self.rate_limit_remaining = None  # Already waited; don't wait for the same reset again
+
+    def _record_rate_limit(self, response):
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset = response.headers.get("X-RateLimit-Reset")
+        try:
+            if remaining is not None:
+                self.rate_limit_remaining = int(remaining)
+            if reset is not None:
+                self.rate_limit_reset = float(reset)
+        except ValueError:
+            pass
+
+    def _wait_for_rate_limit(self):
+        """Hold off before sending when the last response said the quota is spent."""
+        if self.rate_limit_remaining != 0 or self.rate_limit_reset is None:
+            return
+        delay = self.rate_limit_reset - time.time()
+        if 0 < delay <= self.max_wait:
+            self.sleep(delay + 1)
+        self.rate_limit_remaining = None
@@ -0,0 +1,79 @@
+import hashlib
+import json
+import os
+import time
+from core.a2a_protocol import A2AMessage
+
+
+class MessageJournal:
+    """Append-only log of A2A messages, one compact JSON document per line.
+
+    Every message an agent produces is appended (and fsynced) as soon as it
+    exists, so an interrupted pipeline can pick up from the last journaled
+    step instead of re-cloning the repo and re-prompting the model.
+
+    A journal not written to for max_age seconds is treated as abandoned and
+    discarded on open, so a stale run is never resumed against a repo that
+    may have changed since.
+    """
+
+    def __init__(self, path, fsync=True, max_age=None):
+        self.path = path
+        self.fsync = fsync
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        if max_age is not None and os.path.exists(self.path):
+            if time.time() - os.path.getmtime(self.path) > max_age:
+                self.clear()
+
+    @classmethod
+    def for_run(cls, journal_dir, *key_parts, max_age=None):
+        """Open the journal for a pipeline run identified by key_parts (repo URL, options...)."""
+        key = json.dumps(key_parts, sort_keys=True, default=str)
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+        return cls(os.path.join(journal_dir, f"{digest}.jsonl"), max_age=max_age)
+
+    def append(self, message: A2AMessage):
+        line = message.to_json(compress=True) + "\n"
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(line)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        return message
+
+    def read(self):
+        """Yield journaled messages in order.
+
+        Reading stops at the first unreadable entry (a torn last line from a
+        crash, or corrupt content), so resume never builds on a bad step.
+        """
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield A2AMessage.from_json(line)
+                except (ValueError, KeyError, TypeError):
+                    break
+
+    def latest_by_type(self):
+        """Map message_type -> most recent message of that type."""
+        latest = {}
+        for message in self.read():
+            latest[message.message_type] = message
+        return latest
+
+    def last(self, message_type=None):
+        found = None
+        for message in self.read():
+            if message_type is None or message.message_type == message_type:
+                found = message
+        return found
+
+    def clear(self):
+        """Drop the journal once a run has completed."""
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,247 @@
+import contextvars
+import json
+import os
+import re
+import threading
+import time
+from collections import deque
+
+
+class _NoopSpan:
+    """Returned by a disabled tracer: no clock reads, no allocation, no locking."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set(self, **attrs):
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class Span:
+    def __init__(self, tracer, name, attrs):
+        self.tracer = tracer
+        self.name = name
+        self.attrs = attrs
+        self.parent = None
+        self.start = None
+        self.wall_start = None
+
+    def set(self, **attrs):
+        self.attrs.update(attrs)
+
+    def __enter__(self):
+        stack = self.tracer._stack()
+        self.parent = stack[-1].name if stack else None
+        stack.append(self)
+        self.wall_start = time.time()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        duration = time.perf_counter() - self.start
+        self.tracer._stack().pop()
+        record = {
+            "name": self.name,
+            "parent": self.parent,
+            "start": self.wall_start,
+            "duration_ms": round(duration * 1000, 3),
+            "error": exc_type.__name__ if exc_type else None,
+        }
+        if self.attrs:
+            record["attrs"] = self.attrs
+        self.tracer._finish(record)
+        return False
+
+
+class Tracer:
+    """In-process spans and counters for the agent pipeline.
+
+    Disabled unless AGENT_TRACING is set (or enabled is flipped at runtime);
+    while disabled, span() hands back a shared no-op object and incr() returns
+    immediately, so instrumented code costs one attribute check.
+    """
+
+    def __init__(self, enabled=None, max_spans=10000):
+        if enabled is None:
+            enabled = os.getenv("AGENT_TRACING", "").lower() in ("1", "true", "yes")
+        self.enabled = enabled
+        self.spans = deque(maxlen=max_spans)
+        self.counters = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _finish(self, record):
+        with self._lock:
+            self.spans.append(record)
+
+    def span(self, name, **attrs):
+        if not self.enabled:
+            return _NOOP_SPAN
+        return Span(self, name, attrs)
+
+    def bind(self, fn):
+        """Wrap fn to run on a worker thread: it reports to this tracer, nested under the current span.
+
+        The tracer is propagated even while disabled; otherwise the worker
+        would fall back to the process default, which AGENT_TRACING may enable.
+        """
+        stack = self._stack() if self.enabled else None
+        parent = stack[-1] if stack else None
+
+        def bound(*args, **kwargs):
+            token = _current.set(self)
+            worker_stack = self._stack()
+            if parent is not None:
+                worker_stack.append(parent)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                if parent is not None:
+                    worker_stack.pop()
+                _current.reset(token)
+        return bound
+
+    def incr(self, name, value=1, **labels):
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def cache(self, cache_name, hit):
+        """Count a hit or miss for a named cache."""
+        self.incr("cache_hits" if hit else "cache_misses", cache=cache_name)
+
+    def reset(self):
+        with self._lock:
+            self.spans.clear()
+            self.counters.clear()
+
+    def summary(self):
+        """Aggregate spans by name: call count, total and max duration, in first-seen order."""
+        rows = {}
+        with self._lock:
+            spans = list(self.spans)
+        for span in spans:
+            row = rows.setdefault(span["name"], {"name": span["name"], "count": 0, "total_ms": 0.0, "max_ms": 0.0})
+            row["count"] += 1
+            row["total_ms"] += span["duration_ms"]
+            row["max_ms"] = max(row["max_ms"], span["duration_ms"])
+        return list(rows.values())
+
+    def cache_hit_rates(self):
+        hits, misses = {}, {}
+        with self._lock:
+            for (name, labels), value in self.counters.items():
+                cache_name = dict(labels).get("cache")
+                if name == "cache_hits":
+                    hits[cache_name] = value
+                elif name == "cache_misses":
+                    misses[cache_name] = value
+        return {c: hits.get(c, 0) / (hits.get(c, 0) + misses.get(c, 0)) for c in set(hits) | set(misses)}
+
+    def to_jsonl(self, path=None):
+        """Spans then counters as JSON lines; appended to path if given."""
+        with self._lock:
+            lines = [json.dumps({"type": "span", **span}, default=str) for span in self.spans]
+            lines += [json.dumps({"type": "counter", "name": name, "labels": dict(labels), "value": value})
+                      for (name, labels), value in self.counters.items()]
+        text = "\n".join(lines) + ("\n" if lines else "")
+        if path:
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(text)
+        return text
+
+    def prometheus_text(self):
+        """Render spans as a summary metric and counters as *_total, in Prometheus text format."""
+        out = [
+            "# HELP agent_span_duration_seconds Time spent in each pipeline span.",
+            "# TYPE agent_span_duration_seconds summary",
+        ]
+        for row in self.summary():
+            label = _prom_labels({"span": row["name"]})
+            out.append(f"agent_span_duration_seconds_sum{label} {row['total_ms'] / 1000:.6f}")
+            out.append(f"agent_span_duration_seconds_count{label} {row['count']}")
+
+        with self._lock:
+            counters = sorted(self.counters.items())
+        seen = set()
+        for (name, labels), value in counters:
+            metric = "agent_" + re.sub(r"[^a-zA-Z0-9_]", "_", name) + "_total"
+            if metric not in seen:
+                seen.add(metric)
+                out.append(f"# TYPE {metric} counter")
+            out.append(f"{metric}{_prom_labels(dict(labels))} {value}")
+        return "\n".join(out) + "\n"
+
+
+def _prom_labels(labels):
+    if not labels:
+        return ""
+    parts = []
+    for key, value in labels.items():
+        value = str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+        parts.append(f'{key}="{value}"')
+    return "{" + ",".join(parts) + "}"
+
+
+def dir_size(path):
+    total = 0
+    for root, _, files in os.walk(path):
+        for file in files:
+            try:
+                total += os.path.getsize(os.path.join(root, file))
+            except OSError:
+                pass
+    return total
+
+
+_current = contextvars.ContextVar("tracer", default=Tracer())
+
+
+def activate(active):
+    """Make active the tracer that `tracer` refers to in the current context (thread/task)."""
+    _current.set(active)
+
+
+class _CurrentTracer:
+    """Proxy for whichever Tracer is active in the calling context.
+
+    Agents instrument against this one name, while each UI session (or test)
+    activates its own Tracer so their spans and toggles never mix.
+    """
+
+    # The hot-path methods are spelled out; __getattr__ only runs after a failed lookup
+    @property
+    def enabled(self):
+        return _current.get().enabled
+
+    def span(self, name, **attrs):
+        return _current.get().span(name, **attrs)
+
+    def incr(self, name, value=1, **labels):
+        _current.get().incr(name, value, **labels)
+
+    def cache(self, cache_name, hit):
+        _current.get().cache(cache_name, hit)
+
+    def __getattr__(self, name):
+        return getattr(_current.get(), name)
+
+    def __setattr__(self, name, value):
+        setattr(_current.get(), name, value)
+
+
+tracer = _CurrentTracer()
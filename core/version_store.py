@@ -0,0 +1,135 @@
+import hashlib
+import json
+import os
+import threading
+import zlib
+from datetime import datetime
+
+# Every Nth stored object is a full snapshot ("keyframe"); the ones in between
+# are deflate streams primed with the keyframe as a preset dictionary, which
+# makes them compressed deltas. Reading any version needs at most two objects.
+KEYFRAME_INTERVAL = 16
+ZDICT_LIMIT = 32 * 1024  # deflate window size; longer dictionaries are truncated
+
+
+class VersionStore:
+    """Content-addressed, deduplicated history of exported files.
+
+    Objects live under objects/<sha256> and are only written for content the
+    store has never seen, so disk use grows with actual changes rather than
+    with the number of exports. index.json records the version list and how
+    each object is encoded.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.objects_dir = os.path.join(root, "objects")
+        self.index_path = os.path.join(root, "index.json")
+        os.makedirs(self.objects_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self._index = self._load_index()
+
+    def _load_index(self):
+        if os.path.exists(self.index_path):
+            with open(self.index_path, encoding="utf-8") as f:
+                return json.load(f)
+        return {"versions": [], "objects": {}, "keyframe": None, "since_keyframe": 0}
+
+    def _save_index(self):
+        tmp = self.index_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self._index, f, separators=(",", ":"))
+        os.replace(tmp, self.index_path)
+
+    @staticmethod
+    def content_hash(data: bytes):
+        return hashlib.sha256(data).hexdigest()
+
+    def _object_path(self, digest):
+        return os.path.join(self.objects_dir, digest)
+
+    def _read_raw(self, digest):
+        with open(self._object_path(digest), "rb") as f:
+            return f.read()
+
+    def _read_object(self, digest):
+        base = self._index["objects"][digest]["base"]
+        if base is None:
+            return zlib.decompress(self._read_raw(digest))
+        zdict = zlib.decompress(self._read_raw(base))[-ZDICT_LIMIT:]
+        decompressor = zlib.decompressobj(zdict=zdict)
+        return decompressor.decompress(self._read_raw(digest)) + decompressor.flush()
+
+    def _write_object(self, digest, data):
+        full = zlib.compress(data, 9)
+        base = self._index["keyframe"]
+        encoded = full
+        if base is not None and self._index["since_keyframe"] < KEYFRAME_INTERVAL:
+            zdict = zlib.decompress(self._read_raw(base))[-ZDICT_LIMIT:]
+            compressor = zlib.compressobj(9, zdict=zdict)
+            delta = compressor.compress(data) + compressor.flush()
+            if len(delta) < len(full):
+                encoded = delta
+        if encoded is full:
+            base = None
+            self._index["keyframe"] = digest
+            self._index["since_keyframe"] = 0
+        else:
+            self._index["since_keyframe"] += 1
+
+        tmp = self._object_path(digest) + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(encoded)
+        os.replace(tmp, self._object_path(digest))
+        self._index["objects"][digest] = {"base": base, "size": len(data), "stored": len(encoded)}
+
+    def put(self, name, data: bytes):
+        """Record data as the newest version of name; a no-op if it is unchanged."""
+        digest = self.content_hash(data)
+        with self._lock:
+            latest = self._latest(name)
+            if latest is not None and latest["hash"] == digest:
+                return latest
+            if digest not in self._index["objects"]:
+                self._write_object(digest, data)
+            return self._add_version(name, digest)
+
+    def _add_version(self, name, digest):
+        version = {
+            "version": len(self._index["versions"]) + 1,
+            "name": name,
+            "hash": digest,
+            "timestamp": datetime.now().isoformat()
+        }
+        self._index["versions"].append(version)
+        self._save_index()
+        return version
+
+    def _latest(self, name):
+        for version in reversed(self._index["versions"]):
+            if version["name"] == name:
+                return version
+        return None
+
+    def history(self, name=None):
+        return [v for v in self._index["versions"] if name is None or v["name"] == name]
+
+    def entry(self, version):
+        """Return the index entry for a 1-based version number."""
+        versions = self._index["versions"]
+        if not isinstance(version, int) or not 1 <= version <= len(versions):
+            raise ValueError(f"Unknown version {version!r}; expected 1..{len(versions)}")
+        return versions[version - 1]
+
+    def get(self, version):
+        """Return the bytes of a version number."""
+        return self._read_object(self.entry(version)["hash"])
+
+    def rollback(self, version, dest_path):
+        """Restore a version to dest_path and record the restore as the newest version."""
+        with self._lock:
+            entry = self.entry(version)
+            data = self._read_object(entry["hash"])
+            with open(dest_path, "wb") as f:
+                f.write(data)
+            return self._add_version(entry["name"], entry["hash"])
@@ -0,0 +1,35 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from benchmarks import run
+
+
+class BenchmarkSmokeTest(unittest.TestCase):
+    def setUp(self):
+        self.out_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.out_dir)
+
+    def test_tiny_detector_run_writes_results(self):
+        output = os.path.join(self.out_dir, "bench.json")
+        run.main(["--scenarios", "detectors", "--files", "5", "--lockfile-entries", "5",
+                  "--repeat", "1", "--timeout", "120", "--output", output])
+        with open(output, encoding="utf-8") as f:
+            report = json.load(f)
+        self.assertEqual(set(report["results"]), {f"analyzer.{name}" for name in run.DETECTORS})
+        self.assertEqual(report["results"]["analyzer.detect_tests"]["runs"], 1)
+        self.assertGreater(report["scenarios"]["detectors"]["peak_rss_kb"], 0)
+
+    def test_worker_error_is_raised_without_waiting_for_timeout(self):
+        with self.assertRaises(RuntimeError) as ctx:
+            run.main(["--scenarios", "detectors", "--files", "5", "--languages", "py=0",
+                      "--repeat", "1", "--timeout", "600", "--output", os.path.join(self.out_dir, "x.json")])
+        self.assertIn("Total of weights", str(ctx.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from agents.exporter import ExportAgent
+
+
+class ExportAgentTest(unittest.TestCase):
+    def setUp(self):
+        self.export_dir = tempfile.mkdtemp()
+        self.exporter = ExportAgent(self.export_dir, formats=("html",))
+
+    def tearDown(self):
+        self.exporter.pool.shutdown()
+        shutil.rmtree(self.export_dir)
+
+    def read(self, name):
+        with open(os.path.join(self.export_dir, name), encoding="utf-8") as f:
+            return f.read()
+
+    def test_concurrent_exports_keep_manifest_readable(self):
+        md_path = os.path.join(self.export_dir, "README.md")
+
+        def export(i):
+            return self.exporter.export_format("html", md_path, f"# {i % 5}", str(i % 5))
+
+        with ThreadPoolExecutor(8) as pool:
+            results = list(pool.map(export, range(400)))
+        self.assertEqual(len(results), 400)
+        self.assertEqual(ExportAgent(self.export_dir, formats=("html",))._manifest,
+                         self.exporter._manifest)
+
+    def test_overlapping_exports_keep_file_and_manifest_in_step(self):
+        render_html = self.exporter.export_to_html
+        a_started = threading.Event()
+
+        def slow_render(content, out_path):
+            rendered = render_html(content, out_path)
+            if content == "# A":
+                # A has written its output but not yet recorded it in the manifest
+                a_started.set()
+                time.sleep(0.2)
+            return rendered
+
+        self.exporter.export_to_html = slow_render
+        md_path = os.path.join(self.export_dir, "README.md")
+        first = threading.Thread(target=self.exporter.export_format, args=("html", md_path, "# A", "a"))
+        first.start()
+        a_started.wait()
+        self.exporter.export_format("html", md_path, "# B", "b")
+        first.join()
+
+        html_text = self.read("README.html")
+        recorded = self.exporter._manifest["README.md:html"]
+        self.assertEqual(html_text, ExportAgent.render_html("# B" if recorded == "b" else "# A"))
+        self.assertEqual([f for f in os.listdir(self.export_dir) if f.endswith(".tmp")], [])
+
+    def test_unchanged_content_skips_rendering_and_versioning(self):
+        self.exporter.save_readme("# Same")
+        path, results = self.exporter.save_readme("# Same")
+        self.assertEqual(path, os.path.join(self.export_dir, "README.md"))
+        self.assertTrue(results["html"]["skipped"])
+        self.assertEqual(len(self.exporter.versions.history()), 1)
+
+    def test_out_of_range_versions_are_rejected(self):
+        self.exporter.save_readme("# One")
+        for version in (0, -1, 2):
+            with self.assertRaises(ValueError):
+                self.exporter.versions.get(version)
+            with self.assertRaises(ValueError):
+                self.exporter.rollback(version)
+
+    def test_rollback_re_exports_other_formats(self):
+        self.exporter.save_readme("# One")
+        self.exporter.save_readme("# Two")
+        restored = self.exporter.rollback(1)
+        self.assertEqual(restored["version"], 3)
+        self.assertEqual(self.read("README.md"), "# One")
+        self.assertIn("One", self.read("README.html"))
+        self.assertIn("html", self.exporter.exported_files("# One"))
+        self.assertEqual(self.exporter.exported_files("# Two"), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
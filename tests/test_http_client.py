@@ -0,0 +1,130 @@
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from core.http_client import GitHubClient
+
+
+class StubGitHub(BaseHTTPRequestHandler):
+    """Replays a scripted list of (status, headers, body) per "METHOD /path"."""
+
+    protocol_version = "HTTP/1.1"
+    script = {}
+    calls = []
+
+    def log_message(self, *args):
+        pass
+
+    def _handle(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        key = f"{self.command} {self.path}"
+        self.calls.append((key, self.headers.get("If-None-Match")))
+        replies = self.script.get(key) or [(404, {}, {})]
+        status, headers, body = replies.pop(0) if len(replies) > 1 else replies[0]
+        data = json.dumps(body).encode() if body is not None else b""
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = do_PUT = do_POST = do_PATCH = _handle
+
+
+class GitHubClientTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StubGitHub)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        StubGitHub.script = {}
+        StubGitHub.calls = []
+        self.sleeps = []
+        self.client = GitHubClient(
+            "token", base_url=f"http://127.0.0.1:{self.server.server_port}",
+            max_retries=3, backoff=0.01, sleep=self.sleeps.append
+        )
+
+    def hits(self, key):
+        return [c for c in StubGitHub.calls if c[0] == key]
+
+    def test_retry_after_is_honoured(self):
+        StubGitHub.script["GET /repos/o/r"] = [
+            (429, {"Retry-After": "7"}, {}),
+            (200, {}, {"default_branch": "main"}),
+        ]
+        response = self.client.get("repos/o/r")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.sleeps, [7.0])
+
+    def test_rate_limit_reset_is_honoured(self):
+        reset = time.time() + 5
+        StubGitHub.script["GET /repos/o/r"] = [
+            (403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset)}, {}),
+            (200, {"X-RateLimit-Remaining": "10"}, {}),
+        ]
+        self.assertEqual(self.client.get("repos/o/r").status_code, 200)
+        self.assertEqual(len(self.sleeps), 1)
+        self.assertGreater(self.sleeps[0], 4)
+
+    def test_put_is_retried_on_server_error(self):
+        StubGitHub.script["PUT /repos/o/r/contents/README.md"] = [(500, {}, {}), (201, {}, {})]
+        self.assertEqual(self.client.put("repos/o/r/contents/README.md", json={}).status_code, 201)
+        self.assertEqual(len(self.hits("PUT /repos/o/r/contents/README.md")), 2)
+
+    def test_post_is_not_retried_on_server_error(self):
+        StubGitHub.script["POST /repos/o/r/pulls"] = [(502, {}, {}), (201, {}, {})]
+        self.assertEqual(self.client.post("repos/o/r/pulls", json={}).status_code, 502)
+        self.assertEqual(len(self.hits("POST /repos/o/r/pulls")), 1)
+        self.assertEqual(self.sleeps, [])
+
+    def test_post_is_retried_when_throttled(self):
+        StubGitHub.script["POST /repos/o/r/git/commits"] = [
+            (403, {"Retry-After": "1"}, {}),
+            (201, {}, {"sha": "c1"}),
+        ]
+        self.assertEqual(self.client.post("repos/o/r/git/commits", json={}).status_code, 201)
+        self.assertEqual(len(self.hits("POST /repos/o/r/git/commits")), 2)
+
+    def test_gives_up_when_wait_exceeds_max_wait(self):
+        StubGitHub.script["GET /repos/o/r"] = [(429, {"Retry-After": "3600"}, {})]
+        self.assertEqual(self.client.get("repos/o/r").status_code, 429)
+        self.assertEqual(self.sleeps, [])
+
+    def test_etag_revalidation_serves_cached_response(self):
+        StubGitHub.script["GET /repos/o/r"] = [
+            (200, {"ETag": '"v1"'}, {"default_branch": "main"}),
+            (304, {}, None),
+        ]
+        first = self.client.get("repos/o/r")
+        second = self.client.get("repos/o/r")
+        self.assertIs(second, first)
+        self.assertEqual(second.json(), {"default_branch": "main"})
+        self.assertEqual([c[1] for c in StubGitHub.calls], [None, '"v1"'])
+        self.assertEqual(self.client.stats["cache_hits"], 1)
+
+    def test_etag_cache_evicts_least_recently_used(self):
+        self.client.cache_size = 2
+        for name in ("a", "b", "c"):
+            StubGitHub.script[f"GET /repos/o/{name}"] = [(200, {"ETag": f'"{name}"'}, {}), (304, {}, None)]
+        self.client.get("repos/o/a")
+        self.client.get("repos/o/b")
+        self.client.get("repos/o/a")  # a is now the most recently used
+        self.client.get("repos/o/c")
+        cached = [key[0].rsplit("/", 1)[1] for key in self.client._etag_cache]
+        self.assertEqual(cached, ["a", "c"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from core.a2a_protocol import A2AMessage, COMPRESS_THRESHOLD
+from core.journal import MessageJournal
+
+
+class A2AMessageTest(unittest.TestCase):
+    def assertSameMessage(self, restored, original):
+        for field in ("from_agent", "to_agent", "message_type", "content", "timestamp", "message_id"):
+            self.assertEqual(getattr(restored, field), getattr(original, field))
+
+    def test_round_trip_uncompressed(self):
+        message = A2AMessage("AnalyzerAgent", "WriterAgent", "repo_summary", "small ✓ summary")
+        text = message.to_json()
+        self.assertNotIn("\n", text)
+        self.assertNotIn("encoding", json.loads(text)["message"])
+        self.assertSameMessage(A2AMessage.from_json(text), message)
+
+    def test_round_trip_compressed(self):
+        message = A2AMessage("WriterAgent", "VisionAgent", "readme_draft", "# Title\n" + "line\n" * COMPRESS_THRESHOLD)
+        text = message.to_json(compress=True)
+        self.assertEqual(json.loads(text)["message"]["encoding"], "zlib+base64")
+        self.assertLess(len(text), len(message.content))
+        self.assertSameMessage(A2AMessage.from_json(text), message)
+
+    def test_small_content_is_not_compressed(self):
+        message = A2AMessage("a", "b", "readme_draft", "short")
+        self.assertNotIn("encoding", message.to_dict(compress=True)["message"])
+
+    def test_indented_form(self):
+        message = A2AMessage("a", "b", "repo_summary", "x")
+        text = message.to_json(indent=4)
+        self.assertIn('\n    "timestamp": ', text)
+        self.assertSameMessage(A2AMessage.from_json(text), message)
+
+    def test_unknown_encoding_is_rejected(self):
+        data = A2AMessage("a", "b", "repo_summary", "x").to_dict()
+        data["message"]["encoding"] = "brotli"
+        with self.assertRaises(ValueError):
+            A2AMessage.from_dict(data)
+
+    def test_corrupt_compressed_content_is_rejected(self):
+        data = A2AMessage("a", "b", "repo_summary", "x" * (COMPRESS_THRESHOLD * 2)).to_dict(compress=True)
+        data["message"]["content"] = "AAAA" + data["message"]["content"][8:]
+        with self.assertRaises(ValueError):
+            A2AMessage.from_dict(data)
+
+
+class MessageJournalTest(unittest.TestCase):
+    def setUp(self):
+        self.journal_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.journal_dir)
+
+    def journal(self, **kwargs):
+        return MessageJournal.for_run(self.journal_dir, "https://github.com/o/r", {"template": "Basic"}, **kwargs)
+
+    def test_latest_by_type_returns_newest_of_each_type(self):
+        journal = self.journal()
+        journal.append(A2AMessage("AnalyzerAgent", "WriterAgent", "repo_summary", "summary"))
+        journal.append(A2AMessage("WriterAgent", "VisionAgent", "readme_draft", "draft 1"))
+        journal.append(A2AMessage("WriterAgent", "VisionAgent", "readme_draft", "draft 2"))
+        latest = self.journal().latest_by_type()
+        self.assertEqual({t: m.content for t, m in latest.items()},
+                         {"repo_summary": "summary", "readme_draft": "draft 2"})
+        self.assertEqual(journal.last().content, "draft 2")
+        self.assertEqual(journal.last("repo_summary").content, "summary")
+
+    def test_torn_last_line_is_ignored(self):
+        journal = self.journal()
+        journal.append(A2AMessage("a", "b", "repo_summary", "summary"))
+        line = A2AMessage("a", "b", "readme_draft", "draft").to_json()
+        with open(journal.path, "a", encoding="utf-8") as f:
+            f.write(line[:len(line) // 2])
+        self.assertEqual(list(journal.latest_by_type()), ["repo_summary"])
+
+    def test_different_keys_use_different_journals(self):
+        self.journal().append(A2AMessage("a", "b", "repo_summary", "summary"))
+        other = MessageJournal.for_run(self.journal_dir, "https://github.com/o/r", {"template": "Detailed"})
+        self.assertEqual(other.latest_by_type(), {})
+
+    def test_stale_journal_expires(self):
+        journal = self.journal()
+        journal.append(A2AMessage("a", "b", "repo_summary", "summary"))
+        an_hour_ago = time.time() - 3600
+        os.utime(journal.path, (an_hour_ago, an_hour_ago))
+
+        self.assertIn("repo_summary", self.journal(max_age=7200).latest_by_type())
+        self.assertEqual(self.journal(max_age=60).latest_by_type(), {})
+        self.assertFalse(os.path.exists(journal.path))
+
+    def test_clear_removes_journal(self):
+        journal = self.journal()
+        journal.append(A2AMessage("a", "b", "repo_summary", "summary"))
+        journal.clear()
+        self.assertEqual(journal.latest_by_type(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
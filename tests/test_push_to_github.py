@@ -0,0 +1,135 @@
+import hashlib
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from agents.push_to_github import GitHubPushAgent
+from core.a2a_protocol import A2AMessage
+from core.http_client import GitHubClient
+
+
+def blob_sha(data: bytes):
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+class StubRepo(BaseHTTPRequestHandler):
+    """Just enough of the Git Data API for one repo, o/r, with README.md on main."""
+
+    protocol_version = "HTTP/1.1"
+    remote = {}
+    refs = {}
+    calls = []
+    pulls_reply = (201, {"html_url": "https://github.com/o/r/pull/1"})
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, body):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length)) if length else None
+
+    def do_GET(self):
+        self.calls.append(("GET", self.path, None))
+        if self.path == "/repos/o/r":
+            return self._reply(200, {"default_branch": "main"})
+        if self.path.startswith("/repos/o/r/git/ref/heads/"):
+            branch = self.path.rsplit("/", 1)[1]
+            if branch in self.refs:
+                return self._reply(200, {"object": {"sha": self.refs[branch]}})
+            return self._reply(404, {})
+        if self.path.startswith("/repos/o/r/git/commits/"):
+            return self._reply(200, {"tree": {"sha": "t0"}})
+        if self.path.startswith("/repos/o/r/git/trees/"):
+            return self._reply(200, {"tree": [
+                {"path": path, "type": "blob", "sha": blob_sha(data)} for path, data in self.remote.items()
+            ]})
+        self._reply(404, {})
+
+    def do_POST(self):
+        body = self._body()
+        self.calls.append(("POST", self.path, body))
+        if self.path.endswith("/pulls"):
+            return self._reply(*self.pulls_reply)
+        replies = {"blobs": {"sha": "b1"}, "trees": {"sha": "t1"}, "commits": {"sha": "c1"}, "refs": {}}
+        self._reply(201, replies[self.path.rsplit("/", 1)[1]])
+
+    def do_PATCH(self):
+        self.calls.append(("PATCH", self.path, self._body()))
+        self._reply(200, {})
+
+
+class PushFilesTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StubRepo)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        StubRepo.remote = {"README.md": b"# Old"}
+        StubRepo.refs = {"main": "c0"}
+        StubRepo.calls = []
+        StubRepo.pulls_reply = (201, {"html_url": "https://github.com/o/r/pull/1"})
+        client = GitHubClient(base_url=f"http://127.0.0.1:{self.server.server_port}", sleep=lambda s: None)
+        self.agent = GitHubPushAgent(None, client=client)
+
+    def writes(self):
+        return [(method, path.replace("/repos/o/r/", "").replace("git/", ""))
+                for method, path, _ in StubRepo.calls if method != "GET"]
+
+    def test_readme_and_extra_files_go_in_one_commit(self):
+        message = A2AMessage("UI", "GitHubPushAgent", "final_readme", "# New")
+        result = self.agent.run("https://github.com/o/r", message,
+                                extra_files={"docs/README.html": "<h1>New</h1>", "docs/diagram.png": b"\x89PNG\xff"})
+        self.assertIn("Pushed 3 of 3", result.content)
+        self.assertEqual(self.writes(), [
+            ("POST", "blobs"), ("POST", "trees"), ("POST", "commits"), ("PATCH", "refs/heads/main"),
+        ])
+        tree = next(body for method, path, body in StubRepo.calls if path.endswith("/git/trees"))
+        self.assertEqual(sorted(e["path"] for e in tree["tree"]), ["README.md", "docs/README.html", "docs/diagram.png"])
+
+    def test_unchanged_files_are_not_uploaded(self):
+        result = self.agent.push_files("https://github.com/o/r", {"README.md": "# Old"})
+        self.assertIn("Already up to date", result)
+        self.assertEqual(self.writes(), [])
+
+    def test_new_branch_and_pull_request(self):
+        result = self.agent.push_files("https://github.com/o/r", {"README.md": "# New"}, branch="docs", open_pr=True)
+        self.assertIn("Pull request opened", result)
+        self.assertEqual(self.writes(), [("POST", "trees"), ("POST", "commits"), ("POST", "refs"), ("POST", "pulls")])
+
+    def test_existing_pull_request_is_reported(self):
+        StubRepo.pulls_reply = (422, {"message": "Validation Failed", "errors": [
+            {"resource": "PullRequest", "code": "custom", "message": "A pull request already exists for o:docs."}
+        ]})
+        result = self.agent.push_files("https://github.com/o/r", {"README.md": "# New"}, branch="docs", open_pr=True)
+        self.assertIn("already open", result)
+
+    def test_other_pull_request_validation_errors_are_shown(self):
+        StubRepo.pulls_reply = (422, {"message": "Validation Failed", "errors": [
+            {"resource": "PullRequest", "code": "custom", "message": "No commits between main and docs"}
+        ]})
+        result = self.agent.push_files("https://github.com/o/r", {"README.md": "# New"}, branch="docs", open_pr=True)
+        self.assertIn("❌ Pull request failed: 422", result)
+        self.assertIn("No commits between main and docs", result)
+
+    def test_pull_request_on_default_branch_is_reported(self):
+        result = self.agent.push_files("https://github.com/o/r", {"README.md": "# New"}, open_pr=True)
+        self.assertIn("No pull request opened", result)
+        self.assertNotIn(("POST", "pulls"), self.writes())
+
+
+if __name__ == "__main__":
+    unittest.main()
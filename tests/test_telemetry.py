@@ -0,0 +1,89 @@
+import contextvars
+import shutil
+import tempfile
+import threading
+import unittest
+
+from agents.exporter import ExportAgent
+from core.telemetry import Tracer, _current, activate, tracer
+
+
+class TracerTest(unittest.TestCase):
+    def test_disabled_tracer_records_nothing(self):
+        local = Tracer(enabled=False)
+        with local.span("step") as span:
+            span.set(bytes=1)
+        local.incr("bytes_cloned", 10)
+        self.assertEqual(list(local.spans), [])
+        self.assertEqual(local.counters, {})
+
+    def test_activated_tracers_are_isolated_per_thread(self):
+        sessions = [Tracer(enabled=True), Tracer(enabled=False)]
+
+        def session(active, name):
+            activate(active)
+            with tracer.span(name):
+                tracer.incr("llm_prompt_tokens", 5)
+
+        threads = [threading.Thread(target=session, args=(t, f"run{i}")) for i, t in enumerate(sessions)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual([s["name"] for s in sessions[0].spans], ["run0"])
+        self.assertEqual(list(sessions[1].spans), [])
+        self.assertEqual(sessions[1].counters, {})
+
+    def test_pool_spans_nest_under_caller(self):
+        export_dir = tempfile.mkdtemp()
+        exporter = ExportAgent(export_dir, formats=("html",))
+        local = Tracer(enabled=True)
+
+        def run():
+            activate(local)
+            exporter.save_readme("# Traced")
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+        exporter.pool.shutdown()
+        shutil.rmtree(export_dir)
+
+        parents = {s["name"]: s["parent"] for s in local.spans}
+        self.assertEqual(parents["export.render"], "export.save_readme")
+        self.assertEqual(parents["export.save_version"], "export.save_readme")
+        self.assertIsNone(parents["export.save_readme"])
+
+    def test_pool_workers_keep_a_disabled_session_tracer(self):
+        default = contextvars.Context().run(_current.get)
+        export_dir = tempfile.mkdtemp()
+        exporter = ExportAgent(export_dir, formats=("html",))
+
+        def run():
+            activate(Tracer(enabled=False))
+            exporter.save_readme("# Untraced")
+
+        was_enabled, default.enabled = default.enabled, True  # as if AGENT_TRACING=1
+        try:
+            thread = threading.Thread(target=run)
+            thread.start()
+            thread.join()
+            exporter.pool.shutdown()
+            self.assertEqual(list(default.spans), [])
+        finally:
+            default.enabled = was_enabled
+            default.reset()
+            shutil.rmtree(export_dir)
+
+    def test_prometheus_text(self):
+        local = Tracer(enabled=True)
+        with local.span("llm.generate"):
+            pass
+        local.cache("github_etag", hit=True)
+        text = local.prometheus_text()
+        self.assertIn('agent_span_duration_seconds_count{span="llm.generate"} 1', text)
+        self.assertIn('agent_cache_hits_total{cache="github_etag"} 1', text)
+
+
+if __name__ == "__main__":
+    unittest.main()